@@ -36,7 +36,7 @@ impl History {
                         let lines = tx
                             .format_transaction_with_args(&ctx.wallet(), None, current_daa_score, true, true, Some(account.clone()))
                             .await;
-                        lines.iter().for_each(|line| tprintln!(ctx, "{line}"));
+                        ctx.term().writeln(lines.join("\n").crlf());
                     }
                     Err(_) => {
                         tprintln!(ctx, "transaction not found");
@@ -118,7 +118,7 @@ impl History {
                                 Some(account.clone()),
                             )
                             .await;
-                        lines.iter().for_each(|line| tprintln!(ctx, "{line}"));
+                        ctx.term().writeln(lines.join("\n").crlf());
                     }
                     Err(err) => {
                         terrorln!(ctx, "Unable to read transaction data: {err}");
@@ -127,11 +127,18 @@ impl Node {
                                 url: Some(url),
                                 ..Default::default()
                             };
-                            for _ in 0..5 {
-                                sleep(Duration::from_millis(1000)).await;
+                            // retry with exponential backoff so that a node that comes up
+                            // quickly is connected to right away, while still allowing
+                            // roughly the same overall time for a slow startup
+                            let mut delay = Duration::from_millis(100);
+                            let mut waited = Duration::ZERO;
+                            while waited < Duration::from_secs(5) {
+                                sleep(delay).await;
+                                waited += delay;
                                 if wrpc_client.connect(Some(options.clone())).await.is_ok() {
                                     break;
                                 }
+                                delay = (delay * 2).min(Duration::from_secs(1));
                             }
                         });
                     }
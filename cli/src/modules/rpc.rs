@@ -14,6 +14,18 @@ impl Rpc {
         ctx.term().writeln(format!("{v:#?}").crlf());
     }
 
+    fn parse_addresses(&self, argv: &[String]) -> Result<Vec<Address>> {
+        Ok(argv.iter().map(|s| Address::try_from(s.as_str())).collect::<std::result::Result<Vec<_>, _>>()?)
+    }
+
+    /// Parse address arguments for requests that carry a list of addresses,
+    /// skipping repeated entries so that the node is not asked to process
+    /// the same address twice.
+    fn parse_unique_addresses(&self, argv: &[String]) -> Result<Vec<Address>> {
+        let mut seen = std::collections::HashSet::with_capacity(argv.len());
+        Ok(self.parse_addresses(argv)?.into_iter().filter(|address| seen.insert(address.clone())).collect())
+    }
+
     async fn main(self: Arc<Self>, ctx: &Arc<dyn Context>, mut argv: Vec<String>, cmd: &str) -> Result<()> {
         let ctx = ctx.clone().downcast_arc::<KaspaCli>()?;
         let rpc = ctx.wallet().rpc_api().clone();
@@ -142,7 +154,7 @@ impl Rpc {
                 if argv.is_empty() {
                     return Err(Error::custom("Please specify at least one address"));
                 }
-                let addresses = argv.iter().map(|s| Address::try_from(s.as_str())).collect::<std::result::Result<Vec<_>, _>>()?;
+                let addresses = self.parse_unique_addresses(&argv)?;
                 let result = rpc.get_utxos_by_addresses_call(GetUtxosByAddressesRequest { addresses }).await?;
                 self.println(&ctx, result);
             }
@@ -150,9 +162,13 @@ impl Rpc {
                 if argv.is_empty() {
                     return Err(Error::custom("Please specify at least one address"));
                 }
-                let addresses = argv.iter().map(|s| Address::try_from(s.as_str())).collect::<std::result::Result<Vec<_>, _>>()?;
-                for address in addresses {
-                    let result = rpc.get_balance_by_address_call(GetBalanceByAddressRequest { address }).await?;
+                let addresses = self.parse_addresses(&argv)?;
+                // requests are independent; issue them concurrently and print one balance per argument, in order
+                let results = futures::future::try_join_all(
+                    addresses.into_iter().map(|address| rpc.get_balance_by_address_call(GetBalanceByAddressRequest { address })),
+                )
+                .await?;
+                for result in results {
                     self.println(&ctx, sompi_to_kaspa(result.balance));
                 }
             }
@@ -160,7 +176,7 @@ impl Rpc {
                 if argv.is_empty() {
                     return Err(Error::custom("Please specify at least one address"));
                 }
-                let addresses = argv.iter().map(|s| Address::try_from(s.as_str())).collect::<std::result::Result<Vec<_>, _>>()?;
+                let addresses = self.parse_unique_addresses(&argv)?;
                 let result = rpc.get_balances_by_addresses_call(GetBalancesByAddressesRequest { addresses }).await?;
                 self.println(&ctx, result);
             }
@@ -196,7 +212,7 @@ impl Rpc {
                 if argv.is_empty() {
                     return Err(Error::custom("Please specify at least one address"));
                 }
-                let addresses = argv.iter().map(|s| Address::try_from(s.as_str())).collect::<std::result::Result<Vec<_>, _>>()?;
+                let addresses = self.parse_unique_addresses(&argv)?;
                 let include_orphan_pool = true;
                 let filter_transaction_pool = true;
                 let result = rpc
@@ -303,13 +303,11 @@ impl UtxoEntries {
         self.0 = Arc::new(items);
     }
 
-    /// Sort the contained entries by amount. Please note that
-    /// this function is not intended for use with large UTXO sets
-    /// as it duplicates the whole contained UTXO set while sorting.
+    /// Sort the contained entries by amount. The entries are sorted
+    /// in place; the UTXO set is only duplicated if it is currently
+    /// shared with another `UtxoEntries` instance.
     pub fn sort(&mut self) {
-        let mut items = (*self.0).clone();
-        items.sort_by_key(|e| e.amount());
-        self.0 = Arc::new(items);
+        Arc::make_mut(&mut self.0).sort_by_key(|e| e.amount());
     }
 
     pub fn amount(&self) -> u64 {
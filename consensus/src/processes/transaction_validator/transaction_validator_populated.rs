@@ -681,4 +681,66 @@ mod tests {
         assert_eq!(tv.check_scripts(&populated_tx), Ok(()));
         assert_eq!(TransactionValidator::check_sig_op_counts(&populated_tx), Ok(()));
     }
+
+    #[test]
+    fn test_sign_many_inputs() {
+        let params = MAINNET_PARAMS.clone();
+        let tv = TransactionValidator::new_for_tests(
+            params.max_tx_inputs,
+            params.max_tx_outputs,
+            params.max_signature_script_len,
+            params.max_script_public_key_len,
+            params.ghostdag_k,
+            params.coinbase_payload_script_public_key_max_len,
+            params.coinbase_maturity,
+            Default::default(),
+        );
+
+        let secp = Secp256k1::new();
+        let (secret_key, public_key) = secp.generate_keypair(&mut rand::thread_rng());
+        let (public_key, _) = public_key.x_only_public_key();
+        let script_pub_key = once(0x20).chain(public_key.serialize()).chain(once(0xac)).collect_vec();
+        let script_pub_key = ScriptVec::from_slice(&script_pub_key);
+
+        let prev_tx_id = TransactionId::from_str("880eb9819a31821d9d2399e2f35e2433b72637e393d71ecc9b8d0250f49153c3").unwrap();
+        let input_count = 16;
+        let unsigned_tx = Transaction::new(
+            0,
+            (0..input_count)
+                .map(|i| TransactionInput {
+                    previous_outpoint: TransactionOutpoint { transaction_id: prev_tx_id, index: i as u32 },
+                    signature_script: vec![],
+                    sequence: i as u64,
+                    sig_op_count: 0,
+                })
+                .collect(),
+            vec![TransactionOutput { value: 300, script_public_key: ScriptPublicKey::new(0, script_pub_key.clone()) }],
+            1615462089000,
+            SubnetworkId::from_bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]),
+            0,
+            vec![],
+        );
+
+        let entries = (0..input_count)
+            .map(|i| UtxoEntry {
+                amount: 100 * (i as u64 + 1),
+                script_public_key: ScriptPublicKey::new(0, script_pub_key.clone()),
+                block_daa_score: 0,
+                is_coinbase: false,
+            })
+            .collect();
+        let schnorr_key = secp256k1::Keypair::from_seckey_slice(secp256k1::SECP256K1, &secret_key.secret_bytes()).unwrap();
+        let signed_tx = sign(MutableTransaction::with_entries(unsigned_tx, entries), schnorr_key);
+        assert_eq!(tv.check_scripts(&signed_tx.as_verifiable()), Ok(()));
+
+        // With several invalid inputs, the error of the lowest failing input is reported
+        let corrupt = |bad_signature: usize, not_push_only: usize| {
+            let mut tx = signed_tx.clone();
+            tx.tx.inputs[bad_signature].signature_script[1] ^= 0xff;
+            tx.tx.inputs[not_push_only].signature_script = vec![0x51, 0x75]; // OP_TRUE OP_DROP
+            tv.check_scripts(&tx.as_verifiable())
+        };
+        assert_eq!(corrupt(3, 10), Err(TxRuleError::SignatureInvalid(TxScriptError::EvalFalse)));
+        assert_eq!(corrupt(10, 3), Err(TxRuleError::SignatureInvalid(TxScriptError::SignatureScriptNotPushOnly)));
+    }
 }
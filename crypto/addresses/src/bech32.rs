@@ -125,8 +125,8 @@ impl Address {
         let (payload_u5, checksum_u5) = address_u5.split_at(address.len() - 8);
         let fivebit_prefix = prefix.as_str().as_bytes().iter().copied().map(|c| c & 0x1fu8);
 
-        // Convert to number
-        let checksum_ = u64::from_be_bytes([vec![0u8; 3], conv5to8(checksum_u5)].concat().try_into().expect("Is exactly 8 bytes"));
+        // Convert to number (8 five-bit groups form the 40-bit checksum)
+        let checksum_ = checksum_u5.iter().fold(0u64, |acc, &c| (acc << 5) | c as u64);
 
         if checksum(payload_u5, fivebit_prefix) != checksum_ {
             return Err(AddressError::BadChecksum);
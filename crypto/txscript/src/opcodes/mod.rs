@@ -708,7 +708,7 @@ opcode_list! {
     opcode OpBlake2b<0xaa, 1>(self, vm) {
         let [last] = vm.dstack.pop_raw()?;
         //let hash = blake2b(last.as_slice());
-        let hash = Params::new().hash_length(32).to_state().update(&last).finalize();
+        let hash = Params::new().hash_length(32).hash(&last);
         vm.dstack.push(hash.as_bytes().to_vec());
         Ok(())
     }
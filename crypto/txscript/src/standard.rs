@@ -48,7 +48,7 @@ pub fn pay_to_address_script(address: &Address) -> ScriptPublicKey {
 
 /// Takes a script and returns an equivalent pay-to-script-hash script
 pub fn pay_to_script_hash_script(redeem_script: &[u8]) -> ScriptPublicKey {
-    let redeem_script_hash = Params::new().hash_length(32).to_state().update(redeem_script).finalize();
+    let redeem_script_hash = Params::new().hash_length(32).hash(redeem_script);
     let script = pay_to_script_hash(redeem_script_hash.as_bytes());
     ScriptPublicKey::new(ScriptClass::ScriptHash.version(), script)
 }
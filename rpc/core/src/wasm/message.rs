@@ -25,6 +25,9 @@ macro_rules! try_from {
     };
 }
 
+// Requests that carry no fields are constructed directly
+// rather than deserialized from the supplied JS value.
+
 // ---
 
 #[wasm_bindgen(typescript_custom_section)]
@@ -54,8 +57,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IPingRequest, PingRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IPingRequest, PingRequest, {
+    Ok(PingRequest {})
 });
 
 declare! {
@@ -84,8 +87,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetBlockCountRequest, GetBlockCountRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetBlockCountRequest, GetBlockCountRequest, {
+    Ok(GetBlockCountRequest {})
 });
 
 declare! {
@@ -117,8 +120,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetBlockDagInfoRequest, GetBlockDagInfoRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetBlockDagInfoRequest, GetBlockDagInfoRequest, {
+    Ok(GetBlockDagInfoRequest {})
 });
 
 declare! {
@@ -158,8 +161,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetCoinSupplyRequest, GetCoinSupplyRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetCoinSupplyRequest, GetCoinSupplyRequest, {
+    Ok(GetCoinSupplyRequest {})
 });
 
 declare! {
@@ -191,8 +194,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetConnectedPeerInfoRequest, GetConnectedPeerInfoRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetConnectedPeerInfoRequest, GetConnectedPeerInfoRequest, {
+    Ok(GetConnectedPeerInfoRequest {})
 });
 
 declare! {
@@ -223,8 +226,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetInfoRequest, GetInfoRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetInfoRequest, GetInfoRequest, {
+    Ok(GetInfoRequest {})
 });
 
 declare! {
@@ -263,8 +266,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetPeerAddressesRequest, GetPeerAddressesRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetPeerAddressesRequest, GetPeerAddressesRequest, {
+    Ok(GetPeerAddressesRequest {})
 });
 
 declare! {
@@ -327,8 +330,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetSinkRequest, GetSinkRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetSinkRequest, GetSinkRequest, {
+    Ok(GetSinkRequest {})
 });
 
 declare! {
@@ -359,8 +362,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetSinkBlueScoreRequest, GetSinkBlueScoreRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetSinkBlueScoreRequest, GetSinkBlueScoreRequest, {
+    Ok(GetSinkBlueScoreRequest {})
 });
 
 declare! {
@@ -391,8 +394,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IShutdownRequest, ShutdownRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IShutdownRequest, ShutdownRequest, {
+    Ok(ShutdownRequest {})
 });
 
 declare! {
@@ -421,8 +424,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetServerInfoRequest, GetServerInfoRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetServerInfoRequest, GetServerInfoRequest, {
+    Ok(GetServerInfoRequest {})
 });
 
 declare! {
@@ -458,8 +461,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetSyncStatusRequest, GetSyncStatusRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetSyncStatusRequest, GetSyncStatusRequest, {
+    Ok(GetSyncStatusRequest {})
 });
 
 declare! {
@@ -874,8 +877,8 @@ declare! {
     "#,
 }
 
-try_from! ( args: IGetCurrentNetworkRequest, GetCurrentNetworkRequest, {
-    Ok(from_value(args.into())?)
+try_from! ( _args: IGetCurrentNetworkRequest, GetCurrentNetworkRequest, {
+    Ok(GetCurrentNetworkRequest {})
 });
 
 declare! {
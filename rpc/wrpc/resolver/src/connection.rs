@@ -5,12 +5,14 @@ const BIAS_SCALE: u64 = 1_000_000;
 #[derive(Debug, Clone)]
 pub struct Descriptor {
     pub connection: Arc<Connection>,
-    pub json: String,
+    /// Pre-serialized JSON response; `Bytes` is reference-counted so
+    /// serving it does not copy the payload on every request.
+    pub json: Bytes,
 }
 
 impl From<&Arc<Connection>> for Descriptor {
     fn from(connection: &Arc<Connection>) -> Self {
-        Self { connection: connection.clone(), json: serde_json::to_string(&Output::from(connection)).unwrap() }
+        Self { connection: connection.clone(), json: serde_json::to_vec(&Output::from(connection)).unwrap().into() }
     }
 }
 
@@ -6,6 +6,7 @@ pub use crate::params::{PathParams, QueryParams};
 pub use crate::result::Result;
 pub use crate::transport::Transport;
 pub use ahash::AHashMap;
+pub use axum::body::Bytes;
 pub use cfg_if::cfg_if;
 pub use futures::{pin_mut, select, FutureExt, StreamExt};
 pub use kaspa_consensus_core::network::NetworkId;
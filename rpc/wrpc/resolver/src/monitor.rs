@@ -204,9 +204,9 @@ impl Monitor {
         serde_json::to_string(&nodes).unwrap()
     }
 
-    /// Get JSON string representing node information (id, url, provider, link)
-    pub fn get_json(&self, params: &PathParams) -> Option<String> {
-        self.descriptors.read().unwrap().get(params).cloned().map(|descriptor| descriptor.json)
+    /// Get JSON representing node information (id, url, provider, link)
+    pub fn get_json(&self, params: &PathParams) -> Option<Bytes> {
+        self.descriptors.read().unwrap().get(params).map(|descriptor| descriptor.json.clone())
     }
 }
 
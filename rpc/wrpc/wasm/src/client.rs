@@ -684,10 +684,12 @@ impl RpcClient {
 
                             let event = NotificationEvent::RpcCtl(ctl);
                             if let Some(handlers) = this.inner.notification_callbacks(event) {
+                                let ctl_value = JsValue::from(ctl.to_string());
+                                let rpc_value = JsValue::from(this.clone());
                                 for handler in handlers.into_iter() {
                                     let event = Object::new();
-                                    event.set("type", &ctl.to_string().into()).ok();
-                                    event.set("rpc", &this.clone().into()).ok();
+                                    event.set("type", &ctl_value).ok();
+                                    event.set("rpc", &rpc_value).ok();
                                     if let Err(err) = handler.call(&event.into()) {
                                         log_error!("Error while executing RPC notification callback: {:?}",err);
                                     }
@@ -711,9 +713,9 @@ impl RpcClient {
                                         notification.set("added", &added).unwrap();
                                         notification.set("removed", &removed).unwrap();
 
+                                        let event_type_value = to_value(&event_type).unwrap();
                                         for handler in handlers.into_iter() {
                                             let event = Object::new();
-                                            let event_type_value = to_value(&event_type).unwrap();
                                             event.set("type", &event_type_value).expect("setting event type");
                                             event.set("data", &notification).expect("setting event data");
                                             if let Err(err) = handler.call(&event.into()) {
@@ -726,11 +728,13 @@ impl RpcClient {
                                     let event_type = notification.event_type();
                                     let notification_event = NotificationEvent::Notification(event_type);
                                     if let Some(handlers) = this.inner.notification_callbacks(notification_event) {
+                                        // convert the notification once and share it between all handlers
+                                        let event_type_value = to_value(&event_type).unwrap();
+                                        let notification_value = notification.to_value().unwrap();
                                         for handler in handlers.into_iter() {
                                             let event = Object::new();
-                                            let event_type_value = to_value(&event_type).unwrap();
                                             event.set("type", &event_type_value).expect("setting event type");
-                                            event.set("data", &notification.to_value().unwrap()).expect("setting event data");
+                                            event.set("data", &notification_value).expect("setting event data");
                                             if let Err(err) = handler.call(&event.into()) {
                                                 log_error!("Error while executing RPC notification callback: {:?}",err);
                                             }
@@ -37,13 +37,13 @@ impl ToHex for &[u8] {
     fn to_hex(&self) -> String {
         // an empty vector is allowed
         if self.is_empty() {
-            return "".to_string();
+            return String::new();
         }
 
         let mut hex = vec![0u8; self.len() * 2];
         faster_hex::hex_encode(self, hex.as_mut_slice()).expect("The output is exactly twice the size of the input");
-        let result = unsafe { str::from_utf8_unchecked(&hex) };
-        result.to_string()
+        // hand the encoded buffer over to the string instead of copying it
+        unsafe { String::from_utf8_unchecked(hex) }
     }
 }
 
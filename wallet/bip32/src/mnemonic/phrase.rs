@@ -234,9 +234,29 @@ impl Mnemonic {
     pub fn to_seed(&self, password: &str) -> Seed {
         let salt = Zeroizing::new(format!("mnemonic{password}"));
         let mut seed = [0u8; Seed::SIZE];
+        // `pbkdf2` keys the HMAC once and clones the padded state for each round,
+        // and `sha2` selects its AVX2 SHA-512 compression at runtime
         pbkdf2::pbkdf2::<Hmac<Sha512>>(self.phrase.as_bytes(), salt.as_bytes(), PBKDF2_ROUNDS, &mut seed).unwrap();
         Seed(seed)
     }
+
+    /// Convert this mnemonic phrase into BIP39 seed values, one for each of the given passwords.
+    /// On native platforms the seeds are derived in parallel.
+    pub fn to_seeds<S>(&self, passwords: &[S]) -> Vec<Seed>
+    where
+        S: AsRef<str> + Sync,
+    {
+        #[cfg(not(target_arch = "wasm32"))]
+        {
+            use rayon::prelude::*;
+            passwords.par_iter().map(|password| self.to_seed(password.as_ref())).collect()
+        }
+
+        #[cfg(target_arch = "wasm32")]
+        {
+            passwords.iter().map(|password| self.to_seed(password.as_ref())).collect()
+        }
+    }
 }
 
 impl Drop for Mnemonic {
@@ -330,4 +350,18 @@ mod tests {
             assert_eq!(&xprv.to_string(prefix).to_string(), xprv_str, "xprv is not valid");
         }
     }
+
+    #[test]
+    pub fn test_to_seeds() {
+        let mnemonic =
+            Mnemonic::new("social anchor educate fold ancient wheel advice praise file fix attitude ivory", Language::English)
+                .unwrap();
+
+        let passwords = ["", "password", "パスワード"];
+        let seeds = mnemonic.to_seeds(&passwords);
+        assert_eq!(seeds.len(), passwords.len());
+        for (seed, password) in seeds.iter().zip(passwords) {
+            assert_eq!(seed.as_bytes(), mnemonic.to_seed(password).as_bytes());
+        }
+    }
 }
@@ -1,8 +1,8 @@
 use crate::types::*;
 use crate::PublicKey;
 use crate::Result;
+use secp256k1::scalar::Scalar;
 pub use secp256k1::SecretKey;
-use secp256k1::{scalar::Scalar, Secp256k1, SignOnly};
 
 pub trait PrivateKey: Sized {
     /// Public key type which corresponds to this private key.
@@ -39,7 +39,6 @@ impl PrivateKey for SecretKey {
     }
 
     fn public_key(&self) -> Self::PublicKey {
-        let engine = Secp256k1::<SignOnly>::signing_only();
-        secp256k1::PublicKey::from_secret_key(&engine, self)
+        secp256k1::PublicKey::from_secret_key_global(self)
     }
 }
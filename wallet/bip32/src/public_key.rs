@@ -1,6 +1,6 @@
 use crate::types::*;
 use ripemd::{Digest, Ripemd160};
-use secp256k1::{scalar::Scalar, Secp256k1, VerifyOnly};
+use secp256k1::{scalar::Scalar, SECP256K1};
 use sha2::Sha256;
 
 /// Trait for key types which can be derived using BIP32.
@@ -33,13 +33,11 @@ impl PublicKey for secp256k1::PublicKey {
     }
 
     fn derive_child(&self, other: PrivateKeyBytes) -> Result<Self> {
-        let engine = Secp256k1::<VerifyOnly>::verification_only();
-
         let other = Scalar::from_be_bytes(other)?;
 
         let child_key = *self;
         let child_key = child_key
-            .add_exp_tweak(&engine, &other)
+            .add_exp_tweak(SECP256K1, &other)
             //.add_exp_assign(&engine, &other)
             .map_err(Error::Crypto)?;
 
@@ -63,11 +63,15 @@ where
 
         let mut hmac = HmacSha512::new_from_slice(&self.attrs.chain_code).map_err(Error::Hmac)?;
 
+        // The parent public key is required for the fingerprint and (for non-hardened
+        // children) for the HMAC input, so we compute it only once
+        let public_key = self.private_key.public_key();
+
         if child_number.is_hardened() {
             hmac.update(&[0]);
             hmac.update(&self.private_key.to_bytes());
         } else {
-            hmac.update(&self.private_key.public_key().to_bytes());
+            hmac.update(&public_key.to_bytes());
         }
 
         hmac.update(&child_number.to_bytes());
@@ -86,12 +90,8 @@ where
         // as the chances of it happening are vanishingly small.
         let private_key = self.private_key.derive_child(child_key.try_into()?)?;
 
-        let attrs = ExtendedKeyAttrs {
-            parent_fingerprint: self.private_key.public_key().fingerprint(),
-            child_number,
-            chain_code: chain_code.try_into()?,
-            depth,
-        };
+        let attrs =
+            ExtendedKeyAttrs { parent_fingerprint: public_key.fingerprint(), child_number, chain_code: chain_code.try_into()?, depth };
 
         Ok(ExtendedPrivateKey { private_key, attrs })
     }
@@ -229,7 +229,9 @@ pub trait Account: AnySync + Send + Sync + 'static {
 
                 let futures = scans.iter().map(|scan| scan.scan(self.utxo_context())).collect::<Vec<_>>();
 
-                join_all(futures).await.into_iter().collect::<Result<Vec<_>>>()?;
+                // fail fast: if one scan errors, the other is dropped instead of being
+                // driven to completion only to have its result discarded
+                futures::future::try_join_all(futures).await?;
             }
             Err(_) => {
                 let mut address_set = HashSet::<Address>::new();
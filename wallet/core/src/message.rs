@@ -31,9 +31,35 @@ pub fn sign_message(msg: &PersonalMessage, privkey: &[u8; 32]) -> Result<Vec<u8>
 /// if any of the inputs are incorrect, or the signature is invalid.
 ///
 pub fn verify_message(msg: &PersonalMessage, signature: &Vec<u8>, pubkey: &XOnlyPublicKey) -> Result<(), Error> {
+    verify_message_signature(msg, signature.as_slice(), pubkey)
+}
+
+/// Verifies a list of signed messages.
+///
+/// Each entry is a `(message, signature, public key)` triple checked with
+/// [`verify_message`]; this is a convenience over looping on the caller's side,
+/// not a batch verifier. Produces `Ok(())` if every signature matches its message,
+/// otherwise returns the indices of all entries that failed verification
+/// (including malformed signatures).
+///
+pub fn verify_messages(entries: &[(PersonalMessage, &[u8], &XOnlyPublicKey)]) -> Result<(), Vec<usize>> {
+    let failed = entries
+        .iter()
+        .enumerate()
+        .filter_map(|(index, (msg, signature, pubkey))| verify_message_signature(msg, signature, pubkey).err().map(|_| index))
+        .collect::<Vec<_>>();
+
+    if failed.is_empty() {
+        Ok(())
+    } else {
+        Err(failed)
+    }
+}
+
+fn verify_message_signature(msg: &PersonalMessage, signature: &[u8], pubkey: &XOnlyPublicKey) -> Result<(), Error> {
     let hash = calc_personal_message_hash(msg);
     let msg = secp256k1::Message::from_digest_slice(hash.as_bytes().as_slice())?;
-    let sig = secp256k1::schnorr::Signature::from_slice(signature.as_slice())?;
+    let sig = secp256k1::schnorr::Signature::from_slice(signature)?;
     sig.verify(&msg, pubkey)
 }
 
@@ -132,6 +158,36 @@ Ut omnis magnam et accusamus earum rem impedit provident eum commodi repellat qu
         assert!(verify_result.is_err());
     }
 
+    #[test]
+    fn test_verify_messages() {
+        let pm = PersonalMessage("Hello Kaspa!");
+        let privkey: [u8; 32] = [
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03,
+        ];
+        let pubkey = XOnlyPublicKey::from_slice(&[
+            0xF9, 0x30, 0x8A, 0x01, 0x92, 0x58, 0xC3, 0x10, 0x49, 0x34, 0x4F, 0x85, 0xF8, 0x9D, 0x52, 0x29, 0xB5, 0x31, 0xC8, 0x45,
+            0x83, 0x6F, 0x99, 0xB0, 0x86, 0x01, 0xF1, 0x13, 0xBC, 0xE0, 0x36, 0xF9,
+        ])
+        .unwrap();
+        let other_pm = PersonalMessage("Not Hello Kaspa!");
+
+        let sig = sign_message(&pm, &privkey).expect("sign_message failed");
+        let other_sig = sign_message(&other_pm, &privkey).expect("sign_message failed");
+        let fake_sig = [0u8; 64];
+
+        verify_messages(&[(pm.clone(), sig.as_slice(), &pubkey), (other_pm.clone(), other_sig.as_slice(), &pubkey)])
+            .expect("verify_messages failed");
+
+        let verify_result = verify_messages(&[
+            (pm.clone(), sig.as_slice(), &pubkey),
+            (other_pm.clone(), sig.as_slice(), &pubkey),
+            (other_pm, other_sig.as_slice(), &pubkey),
+            (pm, fake_sig.as_slice(), &pubkey),
+        ]);
+        assert_eq!(verify_result, Err(vec![1, 3]));
+    }
+
     #[test]
     fn test_sign_and_verify_test_case_0() {
         let pm = PersonalMessage("Hello Kaspa!");
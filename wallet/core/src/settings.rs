@@ -6,7 +6,7 @@ use crate::imports::*;
 use crate::result::Result;
 use crate::storage::local::Storage;
 use serde::de::DeserializeOwned;
-use serde_json::{from_value, to_value, Map, Value};
+use serde_json::{to_value, Map, Value};
 use std::hash::Hash;
 use std::marker::PhantomData;
 use std::path::PathBuf;
@@ -66,7 +66,8 @@ where
         let ks = ks.as_str().expect("Unable to convert key to string");
         let s = self.map.get(ks); //&key.to_string());
         if let Some(s) = s {
-            match from_value::<V>(s.value().clone()) {
+            // deserialize from the stored value in place rather than cloning it first
+            match V::deserialize(s.value()) {
                 Ok(v) => Some(v),
                 Err(err) => {
                     log_error!("Unable to parse setting key `{ks}`: `{err}`");
@@ -153,9 +154,9 @@ where
     where
         V: Serialize + DeserializeOwned + Send + Sync + 'static,
     {
-        if let Some(v) = self.map.get(&key.to_string()).map(|v| v.value().clone()) {
+        if let Some(v) = self.map.get(key) {
             //serde_json::from_str(&v).ok()
-            from_value(v).ok()
+            V::deserialize(v.value()).ok()
         } else {
             None
         }
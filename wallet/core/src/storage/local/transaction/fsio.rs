@@ -14,6 +14,9 @@ use std::{
 };
 use workflow_store::fs;
 
+// number of transaction record files read concurrently by `read_multiple()`
+const READ_CONCURRENCY: usize = 16;
+
 pub struct Inner {
     known_folders: HashSet<String>,
 }
@@ -112,21 +115,7 @@ impl TransactionRecordStore for TransactionStore {
         ids: &[TransactionId],
     ) -> Result<Vec<Arc<TransactionRecord>>> {
         let folder = self.ensure_folder(binding, network_id).await?;
-        let mut transactions = vec![];
-
-        for id in ids {
-            let path = folder.join(&id.to_hex());
-            match read(&path, None).await {
-                Ok(tx) => {
-                    transactions.push(Arc::new(tx));
-                }
-                Err(err) => {
-                    log_error!("Error loading transaction {id}: {:?}", err);
-                }
-            }
-        }
-
-        Ok(transactions)
+        Ok(read_multiple(&folder, ids.iter()).await)
     }
 
     async fn load_range(
@@ -165,18 +154,7 @@ impl TransactionRecordStore for TransactionStore {
             located
         } else {
             let iter = ids.iter().skip(range.start).take(range.len());
-
-            for id in iter {
-                let path = folder.join(&id.to_hex());
-                match read(&path, None).await {
-                    Ok(tx) => {
-                        transactions.push(Arc::new(tx));
-                    }
-                    Err(err) => {
-                        log_error!("Error loading transaction {id}: {:?}", err);
-                    }
-                }
-            }
+            transactions = read_multiple(&folder, iter).await;
 
             ids.len()
         };
@@ -303,6 +281,31 @@ async fn read(path: &Path, secret: Option<&Secret>) -> Result<TransactionRecord>
     Ok(encryptable.decrypt(secret)?.unwrap())
 }
 
+/// Read a set of independent transaction records concurrently (at most
+/// [`READ_CONCURRENCY`] files at a time), preserving the order of the
+/// supplied ids. Records that fail to load are logged and skipped.
+async fn read_multiple<'a>(folder: &Path, ids: impl Iterator<Item = &'a TransactionId> + Send) -> Vec<Arc<TransactionRecord>> {
+    let results = futures::stream::iter(ids)
+        .map(|id| {
+            let path = folder.join(id.to_hex());
+            async move { (id, read(&path, None).await) }
+        })
+        .buffered(READ_CONCURRENCY)
+        .collect::<Vec<_>>()
+        .await;
+
+    results
+        .into_iter()
+        .filter_map(|(id, result)| match result {
+            Ok(tx) => Some(Arc::new(tx)),
+            Err(err) => {
+                log_error!("Error loading transaction {id}: {:?}", err);
+                None
+            }
+        })
+        .collect()
+}
+
 fn read_sync(path: &Path, secret: Option<&Secret>) -> Result<TransactionRecord> {
     let bytes = fs::read_sync(path)?;
     let encryptable = Encryptable::<TransactionRecord>::try_from_slice(bytes.as_slice())?;
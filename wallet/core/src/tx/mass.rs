@@ -281,8 +281,7 @@ impl MassCalculator {
     }
 
     pub fn calc_signature_mass_for_inputs(&self, number_of_inputs: usize, minimum_signatures: u16) -> u64 {
-        let minimum_signatures = std::cmp::max(1, minimum_signatures);
-        SIGNATURE_SIZE * self.mass_per_tx_byte * minimum_signatures as u64 * number_of_inputs as u64
+        self.calc_signature_mass(minimum_signatures) * number_of_inputs as u64
     }
 
     pub fn calc_minimum_transaction_fee_from_mass(&self, mass: u64) -> u64 {
@@ -294,8 +293,7 @@ impl MassCalculator {
     }
 
     pub fn calc_minium_transaction_relay_fee(&self, tx: &Transaction, minimum_signatures: u16) -> u64 {
-        let mass = self.calc_mass_for_transaction(tx) + self.calc_signature_mass_for_inputs(tx.inputs.len(), minimum_signatures);
-        calc_minimum_required_transaction_relay_fee(mass)
+        calc_minimum_required_transaction_relay_fee(self.calc_mass_for_signed_transaction(tx, minimum_signatures))
     }
 
     pub fn calc_tx_storage_fee(&self, is_coinbase: bool, inputs: &[UtxoEntryReference], outputs: &[TransactionOutput]) -> u64 {
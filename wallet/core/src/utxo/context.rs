@@ -327,7 +327,7 @@ impl UtxoContext {
     pub async fn remove(&self, utxos: Vec<UtxoEntryReference>) -> Result<Vec<UtxoEntryVariant>> {
         let mut context = self.context();
         let mut removed = vec![];
-        let mut remove_mature_ids = vec![];
+        let mut remove_mature_ids = AHashSet::new();
 
         for utxo in utxos.into_iter() {
             let id = utxo.id();
@@ -344,21 +344,25 @@ impl UtxoContext {
                         log_error!("Error: unable to remove utxo entry from global pending (with context)");
                     }
                 } else {
-                    remove_mature_ids.push(id);
+                    remove_mature_ids.insert(id);
                 }
             } else {
                 log_error!("Error: UTXO not found in UtxoContext map!");
             }
         }
 
-        context.mature.retain(|entry| {
-            if remove_mature_ids.contains(&entry.id()) {
-                removed.push(UtxoEntryVariant::Mature(entry.clone()));
-                false
-            } else {
-                true
-            }
-        });
+        // a set lookup keeps this linear in the size of the mature list
+        // instead of scanning every removed id for each mature entry
+        if !remove_mature_ids.is_empty() {
+            context.mature.retain(|entry| {
+                if remove_mature_ids.contains(entry.id_as_ref()) {
+                    removed.push(UtxoEntryVariant::Mature(entry.clone()));
+                    false
+                } else {
+                    true
+                }
+            });
+        }
 
         Ok(removed)
     }
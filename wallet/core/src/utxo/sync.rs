@@ -7,7 +7,7 @@ use crate::imports::*;
 use crate::result::Result;
 use futures::pin_mut;
 use futures::stream::StreamExt;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 struct Inner {
     task_ctl: DuplexChannel,
     rpc: Mutex<Option<Rpc>>,
@@ -175,10 +175,13 @@ impl SyncMonitor {
     }
 
     pub async fn handle_stdout(&self, text: &str) -> Result<()> {
-        let lines = text.split('\n').collect::<Vec<_>>();
+        // most node output carries no sync markers; skip such chunks without splitting them
+        if !self.inner.state_observer.prefilter.is_match(text) {
+            return Ok(());
+        }
 
         let mut state: Option<SyncState> = None;
-        for line in lines {
+        for line in text.split('\n') {
             if !line.is_empty() {
                 if let Some(new_state) = self.inner.state_observer.get(line) {
                     state.replace(new_state);
@@ -193,9 +196,18 @@ impl SyncMonitor {
     }
 }
 
+const PROOF: &str = r"Validating level (\d+) from the pruning point proof";
+const IBD_HEADERS: &str = r"IBD: Processed (\d+) block headers \((\d+)%\)";
+const IBD_BLOCKS: &str = r"IBD: Processed (\d+) blocks \((\d+)%\)";
+const UTXO_RESYNC: &str = r"Resyncing the utxoindex...";
+const UTXO_SYNC: &str = r"Received (\d+) UTXO set chunks so far, totaling in (\d+) UTXOs";
+const TRUST_BLOCKS: &str = r"Processed (\d+) trusted blocks in the last .* \(total (\d+)\)";
+
 // This is a temporary implementation that extracts sync state from the node's stdout.
 // This will be removed one a proper RPC notification API is implemented.
 pub struct StateObserver {
+    // all of the patterns below, matched in a single pass
+    prefilter: RegexSet,
     proof: Regex,
     ibd_headers: Regex,
     ibd_blocks: Regex,
@@ -208,12 +220,13 @@ pub struct StateObserver {
 impl Default for StateObserver {
     fn default() -> Self {
         Self {
-            proof: Regex::new(r"Validating level (\d+) from the pruning point proof").unwrap(),
-            ibd_headers: Regex::new(r"IBD: Processed (\d+) block headers \((\d+)%\)").unwrap(),
-            ibd_blocks: Regex::new(r"IBD: Processed (\d+) blocks \((\d+)%\)").unwrap(),
-            utxo_resync: Regex::new(r"Resyncing the utxoindex...").unwrap(),
-            utxo_sync: Regex::new(r"Received (\d+) UTXO set chunks so far, totaling in (\d+) UTXOs").unwrap(),
-            trust_blocks: Regex::new(r"Processed (\d) trusted blocks in the last .* (total (\d))").unwrap(),
+            prefilter: RegexSet::new([PROOF, IBD_HEADERS, IBD_BLOCKS, UTXO_RESYNC, UTXO_SYNC, TRUST_BLOCKS]).unwrap(),
+            proof: Regex::new(PROOF).unwrap(),
+            ibd_headers: Regex::new(IBD_HEADERS).unwrap(),
+            ibd_blocks: Regex::new(IBD_BLOCKS).unwrap(),
+            utxo_resync: Regex::new(UTXO_RESYNC).unwrap(),
+            utxo_sync: Regex::new(UTXO_SYNC).unwrap(),
+            trust_blocks: Regex::new(TRUST_BLOCKS).unwrap(),
             // accepted_block: Regex::new(r"Accepted block .* via").unwrap(),
         }
     }
@@ -221,6 +234,10 @@ impl Default for StateObserver {
 
 impl StateObserver {
     pub fn get(&self, line: &str) -> Option<SyncState> {
+        if !self.prefilter.is_match(line) {
+            return None;
+        }
+
         let mut state: Option<SyncState> = None;
 
         if let Some(captures) = self.ibd_headers.captures(line) {
@@ -260,3 +277,42 @@ impl StateObserver {
         state
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_state_observer() {
+        let observer = StateObserver::default();
+
+        let state = |line: &str| {
+            assert!(observer.prefilter.is_match(line), "prefilter rejects `{line}`");
+            observer.get(line)
+        };
+
+        assert!(matches!(
+            state("Validating level 3 from the pruning point proof (2000 headers)"),
+            Some(SyncState::Proof { level: 3 })
+        ));
+        assert!(matches!(
+            state("IBD: Processed 12000 block headers (42%) last block timestamp: 2024-01-01 00:00:00.000"),
+            Some(SyncState::Headers { headers: 12000, progress: 42 })
+        ));
+        assert!(matches!(
+            state("IBD: Processed 5300 blocks (17%) last block timestamp: 2024-01-01 00:00:00.000"),
+            Some(SyncState::Blocks { blocks: 5300, progress: 17 })
+        ));
+        assert!(matches!(
+            state("Received 120 UTXO set chunks so far, totaling in 120000 UTXOs"),
+            Some(SyncState::UtxoSync { chunks: 120, total: 120000 })
+        ));
+        assert!(matches!(
+            state("Processed 15 trusted blocks in the last 1.00s (total 340)"),
+            Some(SyncState::TrustSync { processed: 15, total: 340 })
+        ));
+        assert!(matches!(state("Resyncing the utxoindex..."), Some(SyncState::UtxoResync)));
+
+        assert!(observer.get("Accepted 3 blocks via relay").is_none());
+    }
+}
@@ -27,6 +27,20 @@ extern "C" {
 /// @category Message Signing
 #[wasm_bindgen(js_name = signMessage)]
 pub fn js_sign_message(value: ISignMessage) -> Result<HexString, Error> {
+    let sig_vec = sign_message_object(value)?;
+    Ok(faster_hex::hex_string(sig_vec.as_slice()).into())
+}
+
+/// Signs a message with the given private key, returning the raw
+/// 64-byte signature instead of its hex representation
+/// (see {@link signMessage}).
+/// @category Message Signing
+#[wasm_bindgen(js_name = signMessageAsBytes, skip_jsdoc)]
+pub fn js_sign_message_as_bytes(value: ISignMessage) -> Result<Vec<u8>, Error> {
+    sign_message_object(value)
+}
+
+fn sign_message_object(value: ISignMessage) -> Result<Vec<u8>, Error> {
     if let Some(object) = Object::try_from(&value) {
         let private_key = object.get_cast::<PrivateKey>("privateKey")?;
         let raw_msg = object.get_string("message")?;
@@ -35,7 +49,7 @@ pub fn js_sign_message(value: ISignMessage) -> Result<HexString, Error> {
         let pm = PersonalMessage(&raw_msg);
         let sig_vec = sign_message(&pm, &privkey_bytes)?;
         privkey_bytes.zeroize();
-        Ok(faster_hex::hex_string(sig_vec.as_slice()).into())
+        Ok(sig_vec)
     } else {
         Err(Error::custom("Failed to parse input"))
     }
@@ -50,7 +64,7 @@ const TS_MESSAGE_TYPES: &'static str = r#"
  */
 export interface IVerifyMessage {
     message: string;
-    signature: HexString;
+    signature: HexString | Uint8Array;
     publicKey: PublicKey | string;
 }
 "#;
@@ -65,17 +79,79 @@ extern "C" {
 /// @category Message Signing
 #[wasm_bindgen(js_name = verifyMessage, skip_jsdoc)]
 pub fn js_verify_message(value: IVerifyMessage) -> Result<bool, Error> {
-    if let Some(object) = Object::try_from(&value) {
+    verify_message_object(&value)
+}
+
+fn verify_message_object(value: &JsValue) -> Result<bool, Error> {
+    if let Some(object) = Object::try_from(value) {
         let public_key = object.get_cast::<PublicKey>("publicKey")?;
         let raw_msg = object.get_string("message")?;
-        let signature = object.get_string("signature")?;
+        let signature_bytes = object.get_vec_u8("signature")?;
 
         let pm = PersonalMessage(&raw_msg);
-        let mut signature_bytes = [0u8; 64];
-        faster_hex::hex_decode(signature.as_bytes(), &mut signature_bytes)?;
-
-        Ok(verify_message(&pm, &signature_bytes.to_vec(), &public_key.as_ref().xonly_public_key).is_ok())
+        Ok(verify_message(&pm, &signature_bytes, &public_key.as_ref().xonly_public_key).is_ok())
     } else {
         Err(Error::custom("Failed to parse input"))
     }
 }
+
+#[wasm_bindgen]
+extern "C" {
+    #[wasm_bindgen(extends = js_sys::Array, typescript_type = "IVerifyMessage[]")]
+    pub type IVerifyMessageArray;
+}
+
+/// Verifies a list of message signatures, each entry carrying its own
+/// message, signature and public key. This is a convenience over calling
+/// {@link verifyMessage} for each entry; signatures are checked one by one.
+/// Returns the indices of the entries that failed verification, so an empty
+/// array means all signatures are valid. Malformed entries (e.g. an invalid
+/// public key or signature hex) are reported as failed rather than throwing.
+/// @category Message Signing
+#[wasm_bindgen(js_name = verifyMessages, skip_jsdoc)]
+pub fn js_verify_messages(values: IVerifyMessageArray) -> Vec<u32> {
+    values
+        .iter()
+        .enumerate()
+        .filter(|(_, value)| !matches!(verify_message_object(value), Ok(true)))
+        .map(|(index, _)| index as u32)
+        .collect()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use wasm_bindgen_test::wasm_bindgen_test;
+
+    fn entry(message: &str, signature: &str, public_key: &str) -> JsValue {
+        let object = Object::new();
+        object.set("message", &JsValue::from_str(message)).unwrap();
+        object.set("signature", &JsValue::from_str(signature)).unwrap();
+        object.set("publicKey", &JsValue::from_str(public_key)).unwrap();
+        object.into()
+    }
+
+    #[wasm_bindgen_test]
+    pub fn test_wasm_verify_messages() {
+        let private_key = "0000000000000000000000000000000000000000000000000000000000000003";
+        let public_key = "f9308a019258c31049344f85f89d5229b531c845836f99b08601f113bce036f9";
+        let sign = |message: &str| {
+            let object = Object::new();
+            object.set("message", &JsValue::from_str(message)).unwrap();
+            object.set("privateKey", &JsValue::from_str(private_key)).unwrap();
+            js_sign_message(object.unchecked_into()).unwrap().as_string().unwrap()
+        };
+        let signature = sign("Hello Kaspa!");
+        let other_signature = sign("Not Hello Kaspa!");
+
+        let values = js_sys::Array::new();
+        values.push(&entry("Hello Kaspa!", &signature, public_key));
+        values.push(&entry("Not Hello Kaspa!", &signature, public_key));
+        values.push(&entry("Not Hello Kaspa!", &other_signature, public_key));
+        values.push(&entry("Hello Kaspa!", "not hex", public_key));
+        values.push(&entry("Hello Kaspa!", &signature, "not a public key"));
+        values.push(&JsValue::from_str("not an object"));
+
+        assert_eq!(js_verify_messages(values.unchecked_into()), vec![1, 3, 4, 5]);
+    }
+}
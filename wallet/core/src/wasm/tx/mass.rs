@@ -77,6 +77,15 @@ impl MassCalculator {
         Ok(self.mc.calc_mass_for_transaction(&tx) as u32)
     }
 
+    /// `calcMassForTransactions()` calculates the mass of each transaction in the
+    /// supplied array, as {@link MassCalculator.calcMassForTransaction} does for a
+    /// single transaction. The masses are returned in the order of the input array.
+    /// Throws on the first element that is not a valid {@link Transaction}.
+    #[wasm_bindgen(js_name=calcMassForTransactions)]
+    pub fn calc_mass_for_transactions(&self, transactions: JsValue) -> Result<Vec<u32>> {
+        transactions.dyn_into::<js_sys::Array>()?.iter().map(|tx| self.calc_mass_for_transaction(&tx)).collect()
+    }
+
     #[wasm_bindgen(js_name=blankTransactionSerializedByteSize)]
     pub fn blank_transaction_serialized_byte_size() -> u32 {
         mass::blank_transaction_serialized_byte_size() as u32
@@ -99,8 +108,7 @@ impl MassCalculator {
             .iter()
             .map(TransactionOutput::try_from)
             .collect::<std::result::Result<Vec<_>, kaspa_consensus_client::error::Error>>()?;
-        let outputs = outputs.iter().map(|output| self.calc_mass_for_output(output)).collect::<Result<Vec<_>>>()?;
-        Ok(outputs.iter().sum())
+        outputs.iter().map(|output| self.calc_mass_for_output(output)).sum()
     }
 
     #[wasm_bindgen(js_name=calcMassForInputs)]
@@ -110,8 +118,7 @@ impl MassCalculator {
             .iter()
             .map(TransactionInput::try_owned_from)
             .collect::<std::result::Result<Vec<_>, kaspa_consensus_client::error::Error>>()?;
-        let inputs = inputs.iter().map(|input| self.calc_mass_for_input(input)).collect::<Result<Vec<_>>>()?;
-        Ok(inputs.iter().sum())
+        inputs.iter().map(|input| self.calc_mass_for_input(input)).sum()
     }
 
     #[wasm_bindgen(js_name=calcMassForOutput)]
@@ -1,9 +1,7 @@
 use crate::imports::*;
 use crate::result::Result;
 use crate::tx::{IPaymentOutputArray, PaymentOutputs};
-use crate::wasm::tx::consensus::get_consensus_params_by_address;
 use crate::wasm::tx::generator::*;
-use crate::wasm::tx::mass::MassCalculator;
 use kaspa_addresses::{Address, AddressT};
 use kaspa_consensus_client::*;
 use kaspa_consensus_core::subnets::SUBNETWORK_ID_NATIVE;
@@ -12,6 +10,8 @@ use kaspa_wallet_macros::declare_typescript_wasm_interface as declare;
 use workflow_core::runtime::is_web;
 
 /// Create a basic transaction without any mass limit checks.
+/// No change output is created and fees are not calculated, so `changeAddress`
+/// and `minimumSignatures` are only validated and have no effect on the result.
 /// @category Wallet SDK
 #[wasm_bindgen(js_name=createTransaction)]
 pub fn create_transaction_js(
@@ -23,9 +23,8 @@ pub fn create_transaction_js(
     sig_op_count: JsValue,
     minimum_signatures: JsValue,
 ) -> crate::result::Result<Transaction> {
-    let change_address = Address::try_cast_from(change_address)?;
-    let params = get_consensus_params_by_address(change_address.as_ref());
-    let mc = MassCalculator::new(params);
+    // argument validation only, see the function docs
+    Address::try_cast_from(change_address)?;
 
     let utxo_entries = if let Some(utxo_entries) = utxo_entry_source.dyn_ref::<js_sys::Array>() {
         utxo_entries.to_vec().iter().map(UtxoEntryReference::try_cast_from).collect::<Result<Vec<_>, _>>()?
@@ -35,19 +34,20 @@ pub fn create_transaction_js(
     let priority_fee: u64 = priority_fee.try_into().map_err(|err| Error::custom(format!("invalid fee value: {err}")))?;
     let payload = payload.try_as_vec_u8().ok().unwrap_or_default();
     let outputs = PaymentOutputs::try_owned_from(outputs)?;
-    let sig_op_count =
-        if !sig_op_count.is_undefined() { sig_op_count.as_f64().expect("sigOpCount should be a number") as u8 } else { 1 };
-
-    let minimum_signatures = if !minimum_signatures.is_undefined() {
-        minimum_signatures.as_f64().expect("minimumSignatures should be a number") as u16
+    let sig_op_count = if !sig_op_count.is_undefined() {
+        sig_op_count.as_f64().ok_or_else(|| Error::custom("sigOpCount should be a number"))? as u8
     } else {
         1
     };
 
+    // argument validation only, see the function docs
+    if !minimum_signatures.is_undefined() && minimum_signatures.as_f64().is_none() {
+        return Err(Error::custom("minimumSignatures should be a number"));
+    }
+
     // ---
 
     let mut total_input_amount = 0;
-    let mut entries = vec![];
 
     let inputs = utxo_entries
         .into_iter()
@@ -55,7 +55,6 @@ pub fn create_transaction_js(
         .map(|(sequence, reference)| {
             let UtxoEntryReference { utxo } = reference.as_ref();
             total_input_amount += utxo.amount();
-            entries.push(reference.as_ref().clone());
             TransactionInput::new(utxo.outpoint.clone(), vec![], sequence as u64, sig_op_count, Some(reference.into_owned()))
         })
         .collect::<Vec<TransactionInput>>();
@@ -68,8 +67,6 @@ pub fn create_transaction_js(
 
     let outputs: Vec<TransactionOutput> = outputs.into();
     let transaction = Transaction::new(None, 0, inputs, outputs, 0, SUBNETWORK_ID_NATIVE, 0, payload)?;
-    let _fee = mc.calc_minimum_transaction_relay_fee(&transaction, minimum_signatures);
-    //let mtx = SignableTransaction::new(transaction, entries.into());
 
     Ok(transaction)
 }
@@ -49,8 +49,11 @@ impl PubkeyDerivationManager {
     }
 
     pub fn derive_pubkey_range(&self, indexes: std::ops::Range<u32>) -> Result<Vec<secp256k1::PublicKey>> {
-        let list = indexes.map(|index| self.derive_pubkey(index)).collect::<Vec<_>>();
-        let keys = list.into_iter().collect::<Result<Vec<_>>>()?;
+        // derive directly into the (pre-sized) output vector, short-circuiting on the first error
+        let mut keys = Vec::with_capacity(indexes.len());
+        for index in indexes {
+            keys.push(self.derive_pubkey(index)?);
+        }
         Ok(keys)
     }
 
@@ -18,7 +18,7 @@
 //!
 
 use crate::imports::*;
-use secp256k1::{Secp256k1, XOnlyPublicKey};
+use secp256k1::{XOnlyPublicKey, SECP256K1};
 use serde_wasm_bindgen::to_value;
 
 /// Data structure that contains a secret and public keys.
@@ -80,8 +80,7 @@ impl Keypair {
     /// JavaScript: `let keypair = Keypair::random();`.
     #[wasm_bindgen]
     pub fn random() -> Result<Keypair, JsError> {
-        let secp = Secp256k1::new();
-        let (secret_key, public_key) = secp.generate_keypair(&mut rand::thread_rng());
+        let (secret_key, public_key) = SECP256K1.generate_keypair(&mut rand::thread_rng());
         let (xonly_public_key, _) = public_key.x_only_public_key();
         Ok(Keypair::new(secret_key, public_key, xonly_public_key))
     }
@@ -90,9 +89,8 @@ impl Keypair {
     /// JavaScript: `let privkey = new PrivateKey(hexString); let keypair = privkey.toKeypair();`.
     #[wasm_bindgen(js_name = "fromPrivateKey")]
     pub fn from_private_key(secret_key: &PrivateKey) -> Result<Keypair, JsError> {
-        let secp = Secp256k1::new();
         let secret_key = secp256k1::SecretKey::from_slice(&secret_key.secret_bytes())?;
-        let public_key = secp256k1::PublicKey::from_secret_key(&secp, &secret_key);
+        let public_key = secp256k1::PublicKey::from_secret_key_global(&secret_key);
         let (xonly_public_key, _) = public_key.x_only_public_key();
         Ok(Keypair::new(secret_key, public_key, xonly_public_key))
     }
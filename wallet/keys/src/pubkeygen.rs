@@ -1,7 +1,7 @@
-use crate::derivation::gen1::WalletDerivationManager;
+use crate::derivation::gen1::{PubkeyDerivationManager, WalletDerivationManager};
 use crate::derivation::traits::WalletDerivationManagerTrait;
 use crate::imports::*;
-use kaspa_addresses::AddressArrayT;
+use kaspa_addresses::{AddressArrayT, Prefix};
 use kaspa_consensus_core::network::NetworkType;
 // use crate::xprv::XPrv;
 
@@ -18,6 +18,30 @@ use kaspa_consensus_core::network::NetworkType;
 pub struct PublicKeyGenerator {
     hd_wallet: WalletDerivationManager,
 }
+
+impl PublicKeyGenerator {
+    /// Derives the addresses for the given index range in a single pass, converting each
+    /// derived key straight into its JS representation without intermediate collections.
+    fn derive_addresses<F>(
+        manager: &PubkeyDerivationManager,
+        network_type: NetworkType,
+        indexes: std::ops::Range<u32>,
+        to_js_value: F,
+    ) -> Result<Array>
+    where
+        F: Fn(Address) -> JsValue,
+    {
+        let prefix = Prefix::from(network_type);
+        let addresses = Array::new_with_length(indexes.len() as u32);
+        for (i, index) in indexes.enumerate() {
+            let pubkey = manager.derive_pubkey(index)?;
+            let address = PubkeyDerivationManager::create_address(&pubkey, prefix, false)?;
+            addresses.set(i as u32, to_js_value(address));
+        }
+        Ok(addresses)
+    }
+}
+
 #[wasm_bindgen]
 impl PublicKeyGenerator {
     #[wasm_bindgen(js_name=fromXPub)]
@@ -84,10 +108,7 @@ impl PublicKeyGenerator {
             (start, end) = (end, start);
         }
         let network_type = NetworkType::try_from(networkType)?;
-        let pubkeys = self.hd_wallet.receive_pubkey_manager().derive_pubkey_range(start..end)?;
-        let addresses =
-            pubkeys.into_iter().map(|pk| PublicKey::from(pk).to_address(network_type)).collect::<Result<Vec<Address>>>()?;
-        Ok(Array::from_iter(addresses.into_iter().map(JsValue::from)).unchecked_into())
+        Ok(Self::derive_addresses(self.hd_wallet.receive_pubkey_manager(), network_type, start..end, JsValue::from)?.unchecked_into())
     }
 
     /// Generate a single Receive Address derivation at a given index.
@@ -105,10 +126,10 @@ impl PublicKeyGenerator {
             (start, end) = (end, start);
         }
         let network_type = NetworkType::try_from(networkType)?;
-        let pubkeys = self.hd_wallet.receive_pubkey_manager().derive_pubkey_range(start..end)?;
-        let addresses =
-            pubkeys.into_iter().map(|pk| PublicKey::from(pk).to_address(network_type)).collect::<Result<Vec<Address>>>()?;
-        Ok(Array::from_iter(addresses.into_iter().map(String::from).map(JsValue::from)).unchecked_into())
+        let addresses = Self::derive_addresses(self.hd_wallet.receive_pubkey_manager(), network_type, start..end, |address| {
+            JsValue::from(String::from(address))
+        })?;
+        Ok(addresses.unchecked_into())
     }
 
     /// Generate a single Receive Address derivation at a given index and return it as a string.
@@ -162,10 +183,7 @@ impl PublicKeyGenerator {
             (start, end) = (end, start);
         }
         let network_type = NetworkType::try_from(networkType)?;
-        let pubkeys = self.hd_wallet.change_pubkey_manager().derive_pubkey_range(start..end)?;
-        let addresses =
-            pubkeys.into_iter().map(|pk| PublicKey::from(pk).to_address(network_type)).collect::<Result<Vec<Address>>>()?;
-        Ok(Array::from_iter(addresses.into_iter().map(JsValue::from)).unchecked_into())
+        Ok(Self::derive_addresses(self.hd_wallet.change_pubkey_manager(), network_type, start..end, JsValue::from)?.unchecked_into())
     }
 
     /// Generate a single Change Address derivation at a given index.
@@ -183,10 +201,10 @@ impl PublicKeyGenerator {
             (start, end) = (end, start);
         }
         let network_type = NetworkType::try_from(networkType)?;
-        let pubkeys = self.hd_wallet.change_pubkey_manager().derive_pubkey_range(start..end)?;
-        let addresses =
-            pubkeys.into_iter().map(|pk| PublicKey::from(pk).to_address(network_type)).collect::<Result<Vec<Address>>>()?;
-        Ok(Array::from_iter(addresses.into_iter().map(String::from).map(JsValue::from)).unchecked_into())
+        let addresses = Self::derive_addresses(self.hd_wallet.change_pubkey_manager(), network_type, start..end, |address| {
+            JsValue::from(String::from(address))
+        })?;
+        Ok(addresses.unchecked_into())
     }
 
     /// Generate a single Change Address derivation at a given index and return it as a string.
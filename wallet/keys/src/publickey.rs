@@ -38,9 +38,19 @@ impl PublicKey {
     /// Create a new [`PublicKey`] from a hex-encoded string.
     #[wasm_bindgen(constructor)]
     pub fn try_new(key: &str) -> Result<PublicKey> {
-        match secp256k1::PublicKey::from_str(key) {
-            Ok(public_key) => Ok((&public_key).into()),
-            Err(_e) => Ok(Self { xonly_public_key: secp256k1::XOnlyPublicKey::from_str(key)?, public_key: None }),
+        // decode the hex string once (SIMD-accelerated) and dispatch
+        // on the key length instead of trying each key format in turn
+        let mut bytes = [0u8; secp256k1::constants::UNCOMPRESSED_PUBLIC_KEY_SIZE];
+        let len = key.len() / 2;
+        if key.len() % 2 != 0 || len > bytes.len() {
+            return Err(secp256k1::Error::InvalidPublicKey.into());
+        }
+        faster_hex::hex_decode(key.as_bytes(), &mut bytes[..len]).map_err(|_| secp256k1::Error::InvalidPublicKey)?;
+
+        if len == secp256k1::constants::SCHNORR_PUBLIC_KEY_SIZE {
+            Ok(Self { xonly_public_key: secp256k1::XOnlyPublicKey::from_slice(&bytes[..len])?, public_key: None })
+        } else {
+            Ok((&secp256k1::PublicKey::from_slice(&bytes[..len])?).into())
         }
     }
 
@@ -249,3 +259,51 @@ impl TryFrom<JsValue> for XOnlyPublicKey {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    // secp256k1 generator point G in each of the accepted encodings
+    const XONLY: &str = "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798";
+    const COMPRESSED: &str = "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798";
+    const UNCOMPRESSED: &str = "0479be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8";
+    const ADDRESS: &str = "kaspa:qpumuen7l8wthtz45p3ftn58pvrs9xlumvkuu2xet8egzkcklqtes4ypce9sf";
+
+    /// Parsing as it was done before hex decoding was dispatched on key length
+    fn try_new_legacy(key: &str) -> Option<PublicKey> {
+        match secp256k1::PublicKey::from_str(key) {
+            Ok(public_key) => Some((&public_key).into()),
+            Err(_) => {
+                secp256k1::XOnlyPublicKey::from_str(key).ok().map(|xonly_public_key| PublicKey { xonly_public_key, public_key: None })
+            }
+        }
+    }
+
+    #[test]
+    fn test_public_key_try_new() {
+        let xonly = secp256k1::XOnlyPublicKey::from_str(XONLY).unwrap();
+        let full = secp256k1::PublicKey::from_str(COMPRESSED).unwrap();
+
+        for (key, public_key) in [(XONLY, None), (COMPRESSED, Some(full)), (UNCOMPRESSED, Some(full))] {
+            let parsed = PublicKey::try_new(key).unwrap();
+            assert_eq!(parsed.xonly_public_key, xonly, "x-only key mismatch for {key}");
+            assert_eq!(parsed.public_key, public_key, "public key mismatch for {key}");
+            assert_eq!(parsed.to_address(NetworkType::Mainnet).unwrap().to_string(), ADDRESS, "address mismatch for {key}");
+
+            let legacy = try_new_legacy(key).unwrap();
+            assert_eq!(parsed.xonly_public_key, legacy.xonly_public_key);
+            assert_eq!(parsed.public_key, legacy.public_key);
+        }
+    }
+
+    #[test]
+    fn test_public_key_try_new_invalid() {
+        let over_long = format!("{UNCOMPRESSED}00");
+        let non_hex = "zz".repeat(32);
+        for key in ["", &COMPRESSED[..65], over_long.as_str(), non_hex.as_str(), &COMPRESSED[..40]] {
+            assert!(PublicKey::try_new(key).is_err(), "key should be rejected: '{key}'");
+            assert!(try_new_legacy(key).is_none(), "key was accepted by the legacy parser: '{key}'");
+        }
+    }
+}
@@ -50,24 +50,28 @@ fn main() {
 
     let signer_pskt: PSKT<Signer> = serde_json::from_str(&ser_updated).expect("Failed to deserialize");
     let mut reused_values = SigHashReusedValues::new();
+    // every signer signs the same transaction, so the per-input sighash messages
+    // are computed by the first signer and reused by the following ones
+    let mut messages: Option<Vec<secp256k1::Message>> = None;
     let mut sign = |signer_pskt: PSKT<Signer>, kp: &Keypair| {
         signer_pskt
             .pass_signature_sync(|tx, sighash| -> Result<Vec<SignInputOk>, String> {
                 let tx = dbg!(tx);
-                tx.tx
-                    .inputs
-                    .iter()
-                    .enumerate()
-                    .map(|(idx, _input)| {
-                        let hash = calc_schnorr_signature_hash(&tx.as_verifiable(), idx, sighash[idx], &mut reused_values);
-                        let msg = secp256k1::Message::from_digest_slice(hash.as_bytes().as_slice()).unwrap();
-                        Ok(SignInputOk {
-                            signature: Signature::Schnorr(kp.sign_schnorr(msg)),
-                            pub_key: kp.public_key(),
-                            key_source: None,
+                let messages = messages.get_or_insert_with(|| {
+                    let verifiable = tx.as_verifiable();
+                    (0..tx.tx.inputs.len())
+                        .map(|idx| {
+                            let hash = calc_schnorr_signature_hash(&verifiable, idx, sighash[idx], &mut reused_values);
+                            secp256k1::Message::from_digest_slice(hash.as_bytes().as_slice()).unwrap()
                         })
-                    })
-                    .collect()
+                        .collect()
+                });
+                // the signer's key is the same for every input
+                let pub_key = kp.public_key();
+                Ok(messages
+                    .iter()
+                    .map(|msg| SignInputOk { signature: Signature::Schnorr(kp.sign_schnorr(*msg)), pub_key, key_source: None })
+                    .collect())
             })
             .unwrap()
     };
@@ -78,6 +82,7 @@ fn main() {
     let ser_combined_signed = serde_json::to_string_pretty(&combined_signed).expect("Failed to serialize after combining signed");
     println!("Combined Signed: {}", ser_combined_signed);
     let pskt_finalizer: PSKT<Finalizer> = serde_json::from_str(&ser_combined_signed).expect("Failed to deserialize");
+    let pub_keys = kps.iter().map(|kp| kp.public_key()).collect::<Vec<_>>();
     let pskt_finalizer = pskt_finalizer
         .finalize_sync(|inner: &Inner| -> Result<Vec<Vec<u8>>, String> {
             Ok(inner
@@ -87,10 +92,10 @@ fn main() {
                     // todo actually required count can be retrieved from redeem_script, sigs can be taken from partial sigs according to required count
                     // considering xpubs sorted order
 
-                    let signatures: Vec<_> = kps
+                    let signatures: Vec<_> = pub_keys
                         .iter()
-                        .flat_map(|kp| {
-                            let sig = input.partial_sigs.get(&kp.public_key()).unwrap().into_bytes();
+                        .flat_map(|pub_key| {
+                            let sig = input.partial_sigs.get(pub_key).unwrap().into_bytes();
                             iter::once(OpData65).chain(sig).chain([input.sighash_type.to_u8()])
                         })
                         .collect();
@@ -1,12 +1,8 @@
 // @ts-ignore
-globalThis.WebSocket = require('websocket').w3cwebsocket; // W3C WebSocket module shim
+globalThis.WebSocket ??= require('websocket').w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const kaspa = require('../../../../nodejs/kaspa');
-const { parseArgs } = require("../utils");
-const {
-    RpcClient,
-    Resolver,
-} = kaspa;
+const { parseArgs, getRpcClient } = require("../utils");
 
 kaspa.initConsolePanicHook();
 
@@ -17,14 +13,9 @@ const {
 
 (async () => {
 
-    const rpc = new RpcClient({
-        // url : "127.0.0.1",
-        // encoding,
-        resolver: new Resolver(),
-        networkId : "mainnet"
-    });
     console.log(`Resolving RPC endpoint...`);
-    await rpc.connect();
+    // shared client, connected once per network/encoding and reused by later calls
+    const rpc = await getRpcClient({ networkId : "mainnet", encoding });
     console.log(`Connecting to ${rpc.url}`)
 
     const info = await rpc.getBalancesByAddresses({ addresses : ["kaspa:qpamkvhgh0kzx50gwvvp5xs8ktmqutcy3dfs9dc3w7lm9rq0zs76vf959mmrp"]});
@@ -3,7 +3,9 @@ let {
     PrivateKey,
     PublicKey,
     signMessage,
+    signMessageAsBytes,
     verifyMessage,
+    verifyMessages,
 } = kaspa;
 
 kaspa.initConsolePanicHook();
@@ -28,3 +30,25 @@ function runDemo(message, privateKey, publicKey) {
 runDemo(message, privkey, pubkey);
 // Using Objects:
 runDemo(message, new PrivateKey(privkey), new PublicKey(pubkey));
+
+// Passing the signature as bytes skips the hex encode/decode round trip:
+let signature = signMessageAsBytes({message, privateKey : privkey});
+if (verifyMessage({message, signature, publicKey : pubkey})) {
+    console.info('Signature bytes verified!');
+} else {
+    console.info('Signature bytes are invalid!');
+}
+
+// Verifying a list of signatures in one call (returns the indices of the failed entries):
+let messages = ['Hello Kaspa!', 'こんにちは世界'];
+let entries = messages.map((message) => ({
+    message,
+    signature : signMessageAsBytes({message, privateKey : privkey}),
+    publicKey : pubkey,
+}));
+let failed = verifyMessages(entries);
+if (failed.length === 0) {
+    console.info('All signatures verified!');
+} else {
+    console.info('Invalid signatures at entries:', Array.from(failed));
+}
@@ -1,5 +1,5 @@
 // @ts-ignore
-globalThis.WebSocket = require('websocket').w3cwebsocket; // W3C WebSocket module shim
+globalThis.WebSocket ??= require('websocket').w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const kaspa = require('../../../../nodejs/kaspa');
 const { parseArgs } = require("../utils");
@@ -37,8 +37,17 @@ const {
 
     // console.log(`Connecting to ${rpc.url}`)
 
-    const info = await rpc.getBlockDagInfo();
+    // wRPC multiplexes requests over the single connection,
+    // so independent calls can be issued without reconnecting
+    // or waiting for each other
+    const [info, serverInfo, syncStatus] = await Promise.all([
+        rpc.getBlockDagInfo(),
+        rpc.getServerInfo(),
+        rpc.getSyncStatus(),
+    ]);
     console.log("GetBlockDagInfo response:", info);
+    console.log("GetServerInfo response:", serverInfo);
+    console.log("GetSyncStatus response:", syncStatus);
 
     await rpc.disconnect();
 })();
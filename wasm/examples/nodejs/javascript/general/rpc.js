@@ -1,5 +1,5 @@
 // @ts-ignore
-globalThis.WebSocket = require('websocket').w3cwebsocket; // W3C WebSocket module shim
+globalThis.WebSocket ??= require('websocket').w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const kaspa = require('../../../../nodejs/kaspa');
 const { parseArgs } = require("../utils");
@@ -19,7 +19,8 @@ const {
 
     const rpc = new RpcClient({
         // url : "127.0.0.1",
-        // encoding,
+        // binary Borsh encoding is used unless `--encoding json` is supplied
+        encoding,
         resolver: new Resolver(),
         networkId
     });
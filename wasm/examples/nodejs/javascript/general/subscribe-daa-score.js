@@ -1,5 +1,5 @@
 // @ts-ignore
-globalThis.WebSocket = require('websocket').w3cwebsocket; // W3C WebSocket module shim
+globalThis.WebSocket ??= require('websocket').w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const kaspa = require('../../../../nodejs/kaspa');
 const { parseArgs } = require("../utils");
@@ -1,4 +1,4 @@
-globalThis.WebSocket = require('websocket').w3cwebsocket; // W3C WebSocket module shim
+globalThis.WebSocket ??= require('websocket').w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const kaspa = require('../kaspa/kaspa_wasm');
 const {parseArgs} = require("../utils");
@@ -1,6 +1,6 @@
 // Run with: node demo.js
 // @ts-ignore
-globalThis.WebSocket = require("websocket").w3cwebsocket;
+globalThis.WebSocket ??= require("websocket").w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const {
     PrivateKey,
@@ -32,6 +32,11 @@ const { encoding, networkId } = require("../utils").parseArgs();
     console.log(`Connecting to ${rpc.url}`);
 
     await rpc.connect();
+    // send the UTXO request right away so it overlaps the sync check; an unsynced
+    // node is still queried, but the request's outcome (including an error) is only
+    // looked at once the node is known to be synced, so the sync message still wins
+    const utxosRequest = rpc.getUtxosByAddresses([sourceAddress]);
+    utxosRequest.catch(() => {}); // not awaited if we exit below
     let { isSynced } = await rpc.getServerInfo();
     if (!isSynced) {
         console.error("Please wait for the node to sync");
@@ -39,15 +44,19 @@ const { encoding, networkId } = require("../utils").parseArgs();
         return;
     }
 
-    let { entries } = await rpc.getUtxosByAddresses([sourceAddress]);
+    let { entries } = await utxosRequest;
 
     if (!entries.length) {
         console.error(`No UTXOs found for address ${sourceAddress}`);
     } else {
         console.info(entries);
 
-        // a very basic JS-driven utxo entry sort
-        entries.sort((a, b) => a.amount > b.amount ? 1 : -1);
+        // a very basic JS-driven utxo entry sort; amounts are read
+        // from the WASM entries once instead of on every comparison
+        entries = entries
+            .map((entry) => ({ amount : entry.amount, entry }))
+            .sort((a, b) => a.amount > b.amount ? 1 : -1)
+            .map(({ entry }) => entry);
 
         // create a transaction generator
         // entries: an array of UtxoEntry
@@ -1,11 +1,13 @@
 // Run with: node demo.js
 // @ts-ignore
-globalThis.WebSocket = require("websocket").w3cwebsocket;
+globalThis.WebSocket ??= require("websocket").w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const {
     PrivateKey,
     RpcClient,
     Generator,
+    MassCalculator,
+    getConsensusParametersByAddress,
     kaspaToSompi,
     initConsolePanicHook
 } = require('../../../../nodejs/kaspa');
@@ -34,6 +36,11 @@ const { encoding, networkId, address : destinationAddress } = require("../utils"
     console.log(`Connecting to ${rpc.url}`);
 
     await rpc.connect();
+    // send the UTXO request right away so it overlaps the sync check; an unsynced
+    // node is still queried, but the request's outcome (including an error) is only
+    // looked at once the node is known to be synced, so the sync message still wins
+    const utxosRequest = rpc.getUtxosByAddresses([sourceAddress]);
+    utxosRequest.catch(() => {}); // not awaited if we exit below
     let { isSynced } = await rpc.getServerInfo();
     if (!isSynced) {
         console.error("Please wait for the node to sync");
@@ -41,16 +48,19 @@ const { encoding, networkId, address : destinationAddress } = require("../utils"
         return;
     }
 
-
-    let { entries } = await rpc.getUtxosByAddresses([sourceAddress]);
+    let { entries } = await utxosRequest;
 
     if (!entries.length) {
         console.error(`No UTXOs found for address ${sourceAddress}`);
     } else {
         console.info(entries);
 
-        // a very basic JS-driven utxo entry sort
-        entries.sort((a, b) => a.amount > b.amount ? 1 : -1);
+        // a very basic JS-driven utxo entry sort; amounts are read
+        // from the WASM entries once instead of on every comparison
+        entries = entries
+            .map((entry) => ({ amount : entry.amount, entry }))
+            .sort((a, b) => a.amount > b.amount ? 1 : -1)
+            .map(({ entry }) => entry);
 
         // create a transaction generator
         // entries: an array of UtxoEntry
@@ -83,12 +93,23 @@ const { encoding, networkId, address : destinationAddress } = require("../utils"
         // transaction generator creates a 
         // sequence of transactions
         // for a requested amount of KAS.
-        // sign and submit these transactions
-        let pending;
+        // sign these transactions
+        let pending, transactions = [];
         while (pending = await generator.next()) {
             await pending.sign([privateKey]);
+            transactions.push(pending);
+        }
+
+        // measure the whole batch with a single call; masses
+        // are returned in the same order as the transactions
+        const massCalculator = new MassCalculator(getConsensusParametersByAddress(sourceAddress));
+        const masses = massCalculator.calcMassForTransactions(transactions.map((pending) => pending.transaction));
+
+        // submissions stay sequential, as each generated transaction
+        // may spend the change output of the previous one
+        for (const [index, pending] of transactions.entries()) {
             let txid = await pending.submit(rpc);
-            console.log("txid:", txid);
+            console.log("txid:", txid, "mass:", masses[index]);
         }
 
         console.log("summary:", generator.summary());
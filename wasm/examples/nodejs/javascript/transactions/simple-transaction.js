@@ -1,6 +1,6 @@
 // Run with: node demo.js
 // @ts-ignore
-globalThis.WebSocket = require("websocket").w3cwebsocket;
+globalThis.WebSocket ??= require("websocket").w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const {
     PrivateKey,
@@ -36,6 +36,11 @@ initConsolePanicHook();
     console.log(`Connecting to ${rpc.url}`);
 
     await rpc.connect();
+    // send the UTXO request right away so it overlaps the sync check; an unsynced
+    // node is still queried, but the request's outcome (including an error) is only
+    // looked at once the node is known to be synced, so the sync message still wins
+    const utxosRequest = rpc.getUtxosByAddresses([sourceAddress]);
+    utxosRequest.catch(() => {}); // not awaited if we exit below
     let { isSynced, virtualDaaScore } = await rpc.getServerInfo();
     if (!isSynced) {
         console.error("Please wait for the node to sync");
@@ -43,15 +48,19 @@ initConsolePanicHook();
         return;
     }
 
-    let { entries } = (await rpc.getUtxosByAddresses([sourceAddress]));
+    let { entries } = await utxosRequest;
 
     if (!entries.length) {
         console.error("No UTXOs found for address");
     } else {
         console.info(entries);
 
-        // a very basic JS-driven utxo entry sort
-        entries.sort((a, b) => a.amount > b.amount ? 1 : -1);
+        // a very basic JS-driven utxo entry sort; amounts are read
+        // from the WASM entries once instead of on every comparison
+        entries = entries
+            .map((entry) => ({ amount : entry.amount, entry }))
+            .sort((a, b) => a.amount > b.amount ? 1 : -1)
+            .map(({ entry }) => entry);
 
         let { transactions, summary } = await createTransactions({
             entries,
@@ -62,6 +71,10 @@ initConsolePanicHook();
 
         console.log("Summary:", summary);
 
+        // transactions are submitted one at a time: when the UTXO set
+        // requires batching, later transactions spend the change outputs
+        // of earlier ones and would be rejected as orphans if they
+        // reached the node first
         for (let pending of transactions) {
             console.log("Pending transaction:", pending);
             console.log("Signing tx with secret key:", privateKey.toString());
@@ -1,6 +1,6 @@
 // Run with: node demo.js
 // @ts-ignore
-globalThis.WebSocket = require("websocket").w3cwebsocket;
+globalThis.WebSocket ??= require("websocket").w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const {
     PrivateKey,
@@ -64,11 +64,12 @@ const { networkId, encoding } = require("../utils").parseArgs();
             return curr.amount + agg;
         }, 0n);
 
-        console.info('Amount sending', total - BigInt(utxos.length) * 2000n)
+        const amount = total - BigInt(utxos.length) * 2000n;
+        console.info('Amount sending', amount)
 
         const outputs = [{
             address,
-            amount: total - BigInt(utxos.length) * 2000n,
+            amount,
         }];
 
         const changeAddress = address;
@@ -1,6 +1,6 @@
 // Run with: node demo.js
 // @ts-ignore
-globalThis.WebSocket = require("websocket").w3cwebsocket;
+globalThis.WebSocket ??= require("websocket").w3cwebsocket; // W3C WebSocket module shim (unless provided natively)
 
 const {
     PrivateKey,
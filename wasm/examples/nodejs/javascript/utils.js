@@ -8,6 +8,8 @@ const {
     Encoding,
     NetworkId,
     Mnemonic,
+    Resolver,
+    RpcClient,
 } = require('../../../nodejs/kaspa');
 
 /**
@@ -85,6 +87,35 @@ function parseArgs(options = {
     };
 }
 
+const rpcClients = new Map();
+
+/**
+ * Helper function returning a connected RPC client for the given network and encoding.
+ * The client is created on first use and shared by all subsequent callers in the same
+ * process, so repeated operations do not pay for the resolver lookup and the WebSocket
+ * handshake again. A client that has been disconnected is reconnected on the next call.
+ * @param networkId The network to connect to
+ * @param encoding The RPC encoding, Borsh by default
+ * @returns {Promise<RpcClient>}
+ */
+async function getRpcClient({ networkId, encoding = Encoding.Borsh }) {
+    const key = `${networkId}:${encoding}`;
+    let pending = rpcClients.get(key);
+    if (!pending) {
+        const rpc = new RpcClient({ resolver: new Resolver(), networkId, encoding });
+        pending = rpc.connect().then(() => rpc);
+        pending.catch(() => rpcClients.delete(key));
+        rpcClients.set(key, pending);
+    }
+
+    const rpc = await pending;
+    if (!rpc.isConnected) {
+        await rpc.connect();
+    }
+    return rpc;
+}
+
 module.exports = {
     parseArgs,
+    getRpcClient,
 };
@@ -1,6 +1,6 @@
 // Run with: node demo.js
 import { w3cwebsocket } from "websocket";
-(globalThis.WebSocket as any) = w3cwebsocket;
+(globalThis.WebSocket as any) ??= w3cwebsocket;
 
 import {
     PrivateKey,
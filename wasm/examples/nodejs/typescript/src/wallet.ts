@@ -1,7 +1,7 @@
 import {version, Wallet} from "../../../../nodejs/kaspa";
 
 import {w3cwebsocket} from "websocket";
-(globalThis.WebSocket as any) = w3cwebsocket;
+(globalThis.WebSocket as any) ??= w3cwebsocket;
 
 (async()=>{
     let wallet = new Wallet({resident: false});